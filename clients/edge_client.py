@@ -5,6 +5,7 @@ import json
 import logging
 from models.edge_models import EdgeProxy, EdgeSharedFlow, EdgeTargetServer, EdgeKVM, EdgeAPIProduct, EdgeDeveloper, EdgeDeveloperApp
 from utils.mock_data import MockDataGenerator
+from utils.http_pool import mount_shared_pool
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class EdgeClient:
         self.org = org
         self.mock_mode = mock_mode
         self.mock_generator = MockDataGenerator()
-        self.session = requests.Session()
+        self.session = mount_shared_pool(requests.Session())
         
         if not mock_mode:
             if token:
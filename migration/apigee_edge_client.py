@@ -4,6 +4,7 @@ import json
 import logging
 from typing import Dict, Any, Optional, List, Tuple
 import base64
+from utils.http_pool import mount_shared_pool
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +17,7 @@ class ApigeeEdgeClient:
         self.base_url = base_url
         self.username = username
         self.password = password
-        self.session = requests.Session()
+        self.session = mount_shared_pool(requests.Session())
         
         # Set up basic auth
         credentials = f"{username}:{password}"
@@ -5,6 +5,7 @@ import logging
 from typing import Dict, Any, Optional, Tuple
 from google.oauth2 import service_account
 from google.auth.transport.requests import Request
+from utils.http_pool import mount_shared_pool
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,7 @@ class ApigeeXClient:
             logger.error(f"Failed to load service account: {str(e)}")
             self.credentials = None
         
-        self.session = requests.Session()
+        self.session = mount_shared_pool(requests.Session())
     
     def _get_access_token(self) -> Optional[str]:
         """Get access token from service account"""
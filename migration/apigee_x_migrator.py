@@ -1,19 +1,101 @@
+import atexit
 import os
 import json
 import sys
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TextIO, Tuple
 from datetime import datetime, timezone
-import requests
 
 # Add the migration directory to the path so we can import resources
 sys.path.insert(0, os.path.dirname(__file__))
 
-from resources import MigrateResources
+from resources import MigrateResources, http_session
 
 # Base directory = backend/
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Shared worker pool for migrate_all, bounding how many resources it
+# migrates at once
+_MIGRATE_POOL = ThreadPoolExecutor(max_workers=10)
+
+# Result lines waiting for the background log writer: (log file, line,
+# restart). A restart line truncates the file and starts it, after the lines
+# queued ahead of it are written. None asks the writer to finish the queued
+# lines, close its files and stop
+_log_queue: "queue.SimpleQueue[Optional[Tuple[Path, str, bool]]]" = queue.SimpleQueue()
+_LOG_BATCH_SIZE = 400
+_log_writer_lock = threading.Lock()
+_log_writer: Optional[threading.Thread] = None
+
+
+def _write_log_lines(handles: Dict[Path, TextIO], path: Path, lines: List[str], mode: str = "a") -> None:
+    """Write lines to a log file with a single write and flush"""
+    try:
+        handle = handles.get(path)
+        if handle is None or mode == "w":
+            if handle is not None:
+                handle.close()
+            handle = handles[path] = open(path, mode, encoding="utf-8")
+        handle.write("".join(lines))
+        handle.flush()
+    except Exception as e:
+        print(f"Failed to write log: {e}")
+
+
+def _write_log_batches() -> None:
+    """Drain queued result lines and write them in batches"""
+    # The writer owns the open log files, one per path
+    handles: Dict[Path, TextIO] = {}
+    stopping = False
+    while not stopping:
+        batch = [_log_queue.get()]
+        try:
+            while len(batch) < _LOG_BATCH_SIZE:
+                batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        # Group the batch per file (keeping line order) so each file gets a
+        # single write and flush
+        lines_by_file: Dict[Path, List[str]] = {}
+        for item in batch:
+            if item is None:
+                stopping = True
+                continue
+            path, line, restart = item
+            if restart:
+                # Lines queued before the restart still belong to the old log
+                pending = lines_by_file.pop(path, None)
+                if pending:
+                    _write_log_lines(handles, path, pending)
+                _write_log_lines(handles, path, [line], mode="w")
+                continue
+            lines_by_file.setdefault(path, []).append(line)
+        for path, lines in lines_by_file.items():
+            _write_log_lines(handles, path, lines)
+    for handle in handles.values():
+        handle.close()
+
+
+def _stop_log_writer() -> None:
+    """Write out every queued line and close the log files"""
+    _log_queue.put(None)
+    _log_writer.join()
+
+
+def _start_log_writer() -> None:
+    """Start the background log writer on first use"""
+    global _log_writer
+    with _log_writer_lock:
+        if _log_writer is None:
+            _log_writer = threading.Thread(target=_write_log_batches, name="migration-log-writer", daemon=True)
+            _log_writer.start()
+            # Lines still queued at exit are written before the process ends
+            atexit.register(_stop_log_writer)
+
 
 class ApigeeXMigrator:
     """
@@ -37,9 +119,11 @@ class ApigeeXMigrator:
         self.folder_name = BASE_DIR / "data_edge"
         # Create log file
         self.log_file = self.logs_dir / "migration_logs.txt"
-        with open(self.log_file, "w+", encoding="utf-8") as f:
-            timestamp = datetime.now(timezone.utc)
-            f.write(f"TimeStamp {timestamp}\n")
+        # The log is restarted and results are written in batches by the
+        # background log writer, in the order they are queued
+        _start_log_writer()
+        timestamp = datetime.now(timezone.utc)
+        _log_queue.put((self.log_file, f"TimeStamp {timestamp}\n", True))
 
     # -------------------------
     # CREDENTIAL VERIFICATION
@@ -78,7 +162,7 @@ class ApigeeXMigrator:
             return False
 
         headers = {"Authorization": f"Bearer {self.apigeex_token}"}
-        r = requests.get(url, headers=headers)
+        r = http_session.get(url, headers=headers)
 
         return r.status_code == 200
     
@@ -93,7 +177,7 @@ class ApigeeXMigrator:
             Dictionary with migration result
         """
         try:
-            if self.resource_exists("targetserver", ts_name.replace(".json", "")):
+            if self.resource_exists("targetserver", ts_name.removesuffix(".json")):
                 return {
                     "resource_type": "targetserver",
                     "resource_name": ts_name,
@@ -147,7 +231,7 @@ class ApigeeXMigrator:
             Dictionary with migration result
         """
         try:
-            kvm_base_name = kvm_name.replace(".json", "")
+            kvm_base_name = kvm_name.removesuffix(".json")
 
             if self.resource_exists("kvm", kvm_base_name):
                 return {
@@ -347,11 +431,14 @@ class ApigeeXMigrator:
             dev_dir = os.path.join(self.folder_name, "developers")
             developer_email = None
             
-            # Search for developer by ID
-            for dev_file in os.listdir(dev_dir):
-                dev_path = os.path.join(dev_dir, dev_file)
-                with open(dev_path, 'r') as f:
-                    dev_data = json.load(f)
+            # Search for developer by ID, scanning entries lazily so the
+            # directory listing is never materialized and we stop at the match
+            with os.scandir(dev_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    with open(entry.path, 'r') as f:
+                        dev_data = json.load(f)
                     if dev_data.get('developerId') == developer_id:
                         developer_email = dev_data.get('email')
                         break
@@ -368,7 +455,7 @@ class ApigeeXMigrator:
             # Check if app already exists
             app_check_url = f"{self.apigeex_mgmt_url}{self.apigeex_org_name}/developers/{developer_email}/apps/{app_name}"
             headers = {"Authorization": f"Bearer {self.apigeex_token}"}
-            check_response = requests.get(app_check_url, headers=headers)
+            check_response = http_session.get(app_check_url, headers=headers)
             
             if check_response.status_code == 200:
                 return {
@@ -528,12 +615,12 @@ class ApigeeXMigrator:
     
     def _log_migration(self, result: Dict[str, Any]):
         try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                line = (
-                    f"|| {result['resource_type']} {result['resource_name']} "
-                    f"|| {result['status_code']} || {result['message']} ||\n"
-                )
-                f.write(line)
+            line = (
+                f"|| {result['resource_type']} {result['resource_name']} "
+                f"|| {result['status_code']} || {result['message']} ||\n"
+            )
+            # Never blocks the migrating worker on file IO
+            _log_queue.put((self.log_file, line, False))
         except Exception as e:
             print(f"Failed to write log: {e}")
 
@@ -563,14 +650,10 @@ class ApigeeXMigrator:
     # ------------------------------------------------------------
     async def migrate_all(self) -> Dict[str, Any]:
         """
-        Runs all migrations in parallel.
+        Runs all migrations in parallel on the shared worker pool.
         """
-        import os
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
-
-        executor = ThreadPoolExecutor(max_workers=10)
-        loop = asyncio.get_event_loop()
+        executor = _MIGRATE_POOL
+        loop = asyncio.get_running_loop()
         tasks = []
 
         # ---------- Target Servers ----------
@@ -651,7 +734,7 @@ class ApigeeXMigrator:
         # ---------- Proxies ----------
         proxy_dir = os.path.join(self.folder_name, "proxies")
         for f in os.listdir(proxy_dir):
-            proxy_name = f.replace(".zip", "")
+            proxy_name = f.removesuffix(".zip")
             tasks.append(
                 loop.run_in_executor(
                     executor,
@@ -664,7 +747,7 @@ class ApigeeXMigrator:
         # ---------- Sharedflows ----------
         sf_dir = os.path.join(self.folder_name, "sharedflows")
         for f in os.listdir(sf_dir):
-            sf_name = f.replace(".zip", "")
+            sf_name = f.removesuffix(".zip")
             tasks.append(
                 loop.run_in_executor(
                     executor,
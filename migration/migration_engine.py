@@ -1,5 +1,6 @@
 """Main migration engine orchestrating the full migration process"""
 import asyncio
+from collections import deque
 from typing import Dict, Any, Optional
 import json
 from datetime import datetime, timezone
@@ -12,7 +13,7 @@ from migration.transformer import ResourceTransformer
 from migration.x_importer import ApigeeXImporter
 from migration.validator import MigrationValidator
 from utils.logger import MigrationLogger
-from models.migration_models import MigrationJob, MigrationStatus, ResourceStatus, MigrationResource
+from models.migration_models import MigrationJob, MigrationStatus, ResourceStatus, MigrationResource, MAX_JOB_LOG_ENTRIES
 
 logger = logging.getLogger(__name__)
 
@@ -94,9 +95,9 @@ class MigrationEngine:
             # Complete migration
             self.job.status = MigrationStatus.COMPLETED
             self.job.completed_at = datetime.now(timezone.utc)
-            self.job.logs = self.logger.get_logs()
-            self.job.errors = self.logger.get_errors()
-            self.job.warnings = self.logger.get_warnings()
+            self.job.logs = deque(self.logger.get_logs(), maxlen=MAX_JOB_LOG_ENTRIES)
+            self.job.errors = deque(self.logger.get_errors(), maxlen=MAX_JOB_LOG_ENTRIES)
+            self.job.warnings = deque(self.logger.get_warnings(), maxlen=MAX_JOB_LOG_ENTRIES)
             
             self.logger.success("=" * 60)
             self.logger.success("MIGRATION COMPLETED SUCCESSFULLY")
@@ -106,7 +107,7 @@ class MigrationEngine:
         except Exception as e:
             self.job.status = MigrationStatus.FAILED
             self.job.completed_at = datetime.now(timezone.utc)
-            self.job.errors = self.logger.get_errors()
+            self.job.errors = deque(self.logger.get_errors(), maxlen=MAX_JOB_LOG_ENTRIES)
             self.logger.error(f"Migration failed: {str(e)}")
             raise
         
@@ -5,12 +5,14 @@ from os import path
 import shutil
 import zipfile as zp
 import re
-import json
+import orjson
 import requests
 from pathlib import Path
 from datetime import date
 from datetime import datetime, timezone
 
+from utils.http_pool import http_session
+
 # Configuration will be passed dynamically via function parameters
 # No global config loading needed
 
@@ -24,7 +26,7 @@ class MigrateResources:
         try:
             url = f"{apigeex_mgmt_url}{org}/{resource}/"
             headers = {'Authorization': f'Bearer {token}'}
-            response = requests.get(url, headers=headers, stream=True)
+            response = http_session.get(url, headers=headers, stream=True)
             status_code = response.status_code
             return response, status_code
         except requests.exceptions.RequestException as e:
@@ -37,9 +39,9 @@ class MigrateResources:
     def Migrate_app(apigeex_mgmt_url, org, token, email, data):
         try:
             url = f"{apigeex_mgmt_url}{org}/developers/{email}/apps"
-            payload = json.dumps(data)
+            payload = orjson.dumps(data)
             headers = {'Authorization': f'Bearer {token}','Content-Type': 'application/json'}
-            response = requests.post(url, headers=headers, data=payload)
+            response = http_session.post(url, headers=headers, data=payload)
             status_code = response.status_code
             response_text = response.text
             return status_code, response_text
@@ -54,9 +56,9 @@ class MigrateResources:
     def Migrate_product(apigeex_mgmt_url, org, token, data):
         try:
             url = f"{apigeex_mgmt_url}{org}/apiproducts"
-            payload = json.dumps(data)
+            payload = orjson.dumps(data)
             headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
-            response = requests.post(url, headers=headers, data=payload)
+            response = http_session.post(url, headers=headers, data=payload)
             status_code = response.status_code
             response_text = response.text
             return status_code, response_text
@@ -111,7 +113,7 @@ class MigrateResources:
             with open(f"{path}/{filename}.zip", 'rb') as file:
                 files = [(f"{filename}.zip", (f"{filename}.zip", file, 'application/zip'))]
                 headers = {'Authorization': f'Bearer {token}'}
-                response = requests.post(url, headers=headers, data=payload, files=files)
+                response = http_session.post(url, headers=headers, data=payload, files=files)
                 status_code = response.status_code
                 print(response.text)
                 response_product_text = response.text
@@ -131,7 +133,7 @@ class MigrateResources:
             with open(f"{path}/{filename}.zip", 'rb') as file:
                 files = [(f"{filename}.zip", (f"{filename}.zip", file, 'application/zip'))]
                 headers = {'Authorization': f'Bearer {token}'}
-                response = requests.post(url, headers=headers, data=payload, files=files)
+                response = http_session.post(url, headers=headers, data=payload, files=files)
                 status_code = response.status_code
                 print(response.text)
                 response_product_text = response.text
@@ -165,9 +167,9 @@ class MigrateResources:
     def Target_Servers(apigeex_mgmt_url, org, token, data, env):
         try:
             url = f"{apigeex_mgmt_url}{org}/environments/{env}/targetservers"
-            payload = json.dumps(data)
+            payload = orjson.dumps(data)
             headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
-            response = requests.post(url, headers=headers, data=payload)
+            response = http_session.post(url, headers=headers, data=payload)
             status_code = response.status_code
             response_product_text = response.text
             return status_code, response_product_text
@@ -184,7 +186,7 @@ class MigrateResources:
         try:
             url = f"{apigeex_mgmt_url}{org}/environments/{env}/keyvaluemaps"
             headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
-            response = requests.post(url, headers=headers, json=data)
+            response = http_session.post(url, headers=headers, data=orjson.dumps(data))
             return response.status_code, response.text
         except requests.exceptions.RequestException as e:
             print(f"Failed with: {e.strerror}")
@@ -197,7 +199,7 @@ class MigrateResources:
         try:
             url = f"{apigeex_mgmt_url}{org}/keyvaluemaps"
             headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
-            response = requests.post(url, headers=headers, json=data)
+            response = http_session.post(url, headers=headers, data=orjson.dumps(data))
             return response.status_code, response.text
         except requests.exceptions.RequestException as e:
             print(f"Failed with: {e.strerror}")
@@ -212,7 +214,7 @@ class MigrateResources:
         try:
             url = f"{apigeex_mgmt_url}{org}/developers"
             headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
-            response = requests.post(url, headers=headers, json=data)
+            response = http_session.post(url, headers=headers, data=orjson.dumps(data))
             print(response.text)  # Print response text
             return response.status_code, response.text
         except requests.exceptions.RequestException as e:
@@ -226,7 +228,7 @@ class MigrateResources:
         try:
             url = f"{apigee_edge_mgmt_url}{org}/developers/{developer_id}"
             headers = {'Authorization': f'Bearer {token}'}
-            response = requests.get(url, headers=headers)
+            response = http_session.get(url, headers=headers)
             status_code = response.status_code
             return response, status_code
         except requests.exceptions.RequestException as e:
@@ -1,10 +1,19 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Dict, Optional, Any
+from pydantic import BaseModel, Field, ConfigDict, field_serializer, field_validator
+from typing import List, Dict, Optional, Any, Deque
+from collections import deque
 from datetime import datetime, timezone
 from enum import Enum
 import uuid
 
 
+# Upper bound on log/error/warning entries kept per job
+MAX_JOB_LOG_ENTRIES = 1000
+
+
+def _bounded_log() -> Deque[str]:
+    return deque(maxlen=MAX_JOB_LOG_ENTRIES)
+
+
 class MigrationStatus(str, Enum):
     PENDING = "pending"
     EXPORTING = "exporting"
@@ -62,10 +71,22 @@ class MigrationJob(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     
-    # Logs
-    logs: List[str] = []
-    errors: List[str] = []
-    warnings: List[str] = []
+    # Logs (bounded; oldest entries are dropped once full)
+    logs: Deque[str] = Field(default_factory=_bounded_log)
+    errors: Deque[str] = Field(default_factory=_bounded_log)
+    warnings: Deque[str] = Field(default_factory=_bounded_log)
+
+    @field_validator("logs", "errors", "warnings")
+    @classmethod
+    def _bound_logs(cls, value: Deque[str]) -> Deque[str]:
+        if value.maxlen != MAX_JOB_LOG_ENTRIES:
+            value = deque(value, maxlen=MAX_JOB_LOG_ENTRIES)
+        return value
+
+    @field_serializer("logs", "errors", "warnings")
+    def _dump_logs(self, value: Deque[str]) -> List[str]:
+        # Dump as plain lists in python mode too, not just mode="json"
+        return list(value)
 
 
 class MigrationJobCreate(BaseModel):
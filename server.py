@@ -1,32 +1,63 @@
 from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 from pathlib import Path
+from collections import OrderedDict
+from types import MappingProxyType
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 import uuid
 from datetime import datetime, timezone
 import asyncio
 from fastapi import HTTPException, BackgroundTasks
 from datetime import datetime, timezone
 import asyncio
+import functools
+import hashlib
+import itertools
+import orjson
+import time
 import uvicorn
 # In-memory storage when MongoDB is not available
 _in_memory_config = None
+# Short-lived cache of the saved config so polling clients and per-resource
+# migrations don't query MongoDB on every request
+_CONFIG_CACHE_TTL = 30.0
+# generation is bumped on every save, so a lookup that started before the
+# save cannot put the old config back once it returns
+_config_cache: Dict[str, Any] = {"config": None, "expires_at": 0.0, "generation": 0}
+# Only the fields the config endpoints and ApigeeXMigrator actually read
+_CONFIG_PROJECTION = {
+    "_id": 0,
+    "apigeex_org_name": 1,
+    "apigeex_token": 1,
+    "apigeex_env": 1,
+    "apigeex_mgmt_url": 1,
+    "folder_name": 1,
+}
 # Import migration models and engine
 from models.migration_models import MigrationJob, MigrationJobCreate, ValidationReport, DiffResult
-from migration.migration_engine import MigrationEngine
+if TYPE_CHECKING:
+    # Only needed for annotations; importing it pulls in the full export/
+    # transform/import pipeline and the Google auth client
+    from migration.migration_engine import MigrationEngine
 from migration.assessment_engine import MigrationAssessment
+from migration.dependency_analyzer import DependencyAnalyzer
 from migration.apigee_x_migrator import ApigeeXMigrator
 from utils.diff_calculator import DiffCalculator
+from utils.edge_data_parser import EdgeDataParser
 from utils.mock_data import MockDataGenerator
 import json
 
 
 ROOT_DIR = Path(__file__).parent
+DEFAULT_MGMT_URL = "https://apigee.googleapis.com/v1/organizations/"
+# Default Edge export folder, resolved once at import
+DEFAULT_FOLDER_NAME = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend", "data_edge"))
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection (optional)
@@ -39,25 +70,18 @@ if mongo_url in ["none", "no", "false", "0", ""]:
     db = None
 
 else:
-    try:
-        client = AsyncIOMotorClient(mongo_url, serverSelectionTimeoutMS=5000)
-        db = client[os.environ.get('DB_NAME', 'apigee_migration')]
-        client.server_info()  # Test the connection
-        print("✓ MongoDB connected")
-    except Exception as e:
-        print(f"⚠ MongoDB not available: {e}")
-        print("⚠ Running in no-database mode (configuration will not persist)")
-        client = None
-        db = None
+    # Connectivity is verified in the lifespan hook, not at import time
+    client = AsyncIOMotorClient(mongo_url, serverSelectionTimeoutMS=5000)
+    db = client[os.environ.get('DB_NAME', 'apigee_migration')]
 
 # Create the main app without a prefix
-app = FastAPI(title="Apigee Edge to X Migration API")
+app = FastAPI(title="Apigee Edge to X Migration API", default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
 # In-memory storage for active migration jobs (in production, use DB)
-active_jobs: Dict[str, MigrationEngine] = {}
+active_jobs: Dict[str, "MigrationEngine"] = {}
 
 
 # Define Models
@@ -71,7 +95,8 @@ class StatusCheck(BaseModel):
 class StatusCheckCreate(BaseModel):
     client_name: str
 
-migration_jobs_memory = []
+# In-memory job store keyed by job id; holds the MigrationJob models directly
+migration_jobs_memory: Dict[str, MigrationJob] = {}
 # === Health Check Routes ===
 @api_router.get("/")
 async def root():
@@ -83,14 +108,30 @@ async def root():
 
 @api_router.get("/status", response_model=List[StatusCheck])
 async def get_status_checks():
-    status_checks = await db.status_checks.find({}, {"_id": 0}).to_list(1000)
-    
-    for check in status_checks:
-        if isinstance(check['timestamp'], str):
-            check['timestamp'] = datetime.fromisoformat(check['timestamp'])
-    
-    return status_checks
+    # Timestamps come back as datetime for BSON dates; any legacy ISO strings
+    # are parsed by the StatusCheck response model
+    return await db.status_checks.find({}, {"_id": 0}).to_list(1000)
+
+
+# === Edge Data Cache ===
 
+# (parsed Edge export, its dependency graph), replaced in one assignment so
+# concurrent to_thread callers never see one export paired with another's graph
+_dependency_cache: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+
+def _parse_edge_data() -> Dict[str, Any]:
+    """Parsed Edge export; EdgeDataParser re-parses only when the data folder has changed"""
+    return EdgeDataParser().parse_all()
+
+def _analyze_dependencies(edge_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Dependency graph for edge_data, computed once per parsed export"""
+    global _dependency_cache
+    cached = _dependency_cache
+    if cached is not None and cached[0] is edge_data:
+        return cached[1]
+    dependencies = DependencyAnalyzer().analyze_dependencies(edge_data)
+    _dependency_cache = (edge_data, dependencies)
+    return dependencies
 
 # === Migration Job Routes ===
 
@@ -106,98 +147,57 @@ async def create_migration_job(job_create: MigrationJobCreate):
     )
 
     # Run assessment immediately
-    from utils.edge_data_parser import EdgeDataParser
-    from migration.dependency_analyzer import DependencyAnalyzer
-    parser = EdgeDataParser()
-    edge_data = parser.parse_all()
+    edge_data = _parse_edge_data()
     
     assessor = MigrationAssessment()
     assessment = assessor.assess_all_resources(edge_data)
     
     # Combine all resource assessments into one list for the job
-    job.resources = (
-        assessment.get("proxy_assessments", []) +
-        assessment.get("shared_flow_assessments", []) +
-        assessment.get("target_server_assessments", []) +
-        assessment.get("kvm_assessments", []) +
-        assessment.get("api_product_assessments", []) +
-        assessment.get("developer_assessments", [])  # if exists
+    keys = (
+        "proxy_assessments",
+        "shared_flow_assessments",
+        "target_server_assessments",
+        "kvm_assessments",
+        "api_product_assessments",
+        "developer_assessments",  # if exists
     )
+    job.resources = list(itertools.chain.from_iterable(assessment.get(k, ()) for k in keys))
     
-    migration_jobs_memory.append(job.model_dump(exclude_unset=False))
+    migration_jobs_memory[job.id] = job
     return job
 
 @api_router.get("/migrations", response_model=List[MigrationJob])
 async def list_migration_jobs():
-    # Convert timestamps from strings → datetime
-    jobs = []
-    for job in migration_jobs_memory:
-        j = job.copy()
-        
-        for key in ["created_at", "started_at", "completed_at"]:
-            if isinstance(j.get(key), str):
-                j[key] = datetime.fromisoformat(j[key])
-        
-        jobs.append(j)
-
-    return jobs
+    # Stored jobs are already validated models; serialize them directly and
+    # return a Response so FastAPI skips re-validating them against response_model
+    return ORJSONResponse(content=[job.model_dump(mode="json") for job in migration_jobs_memory.values()])
 
 
 @api_router.get("/migrations/{job_id}", response_model=MigrationJob)
 async def get_migration_job(job_id: str):
     # Look up in memory
-    job_dict = next((j for j in migration_jobs_memory if j["id"] == job_id), None)
+    job = migration_jobs_memory.get(job_id)
 
-    if not job_dict:
+    if not job:
         raise HTTPException(status_code=404, detail="Migration job not found")
 
-    # Convert timestamps safely
-    j = job_dict.copy()
-    for key in ["created_at", "started_at", "completed_at"]:
-        if j.get(key) and isinstance(j[key], str):
-            j[key] = datetime.fromisoformat(j[key])
-
-    return MigrationJob(**j)
+    return job
 
 @api_router.post("/migrations/{job_id}/start")
 async def start_migration(job_id: str, background_tasks: BackgroundTasks):
     """Start a migration job safely in NO-DATABASE mode"""
 
     # 1️⃣ Find job in memory
-    job_dict = next((j for j in migration_jobs_memory if j["id"] == job_id), None)
-    if not job_dict:
+    job = migration_jobs_memory.get(job_id)
+    if not job:
         raise HTTPException(status_code=404, detail="Migration job not found")
 
-    # 2️⃣ Ensure list fields exist
-    job_dict.setdefault("resources", [])
-    job_dict.setdefault("logs", [])
-    job_dict.setdefault("errors", [])
-    job_dict.setdefault("warnings", [])
-
-    # 3️⃣ Filter only known fields for MigrationJob
-    allowed_fields = set(MigrationJob.model_fields.keys())
-    safe_dict = {k: v for k, v in job_dict.items() if k in allowed_fields}
-
-    # 4️⃣ Define SafeMigrationJob ignoring extra fields inside nested dicts
-    class SafeMigrationJob(MigrationJob):
-        model_config = {"extra": "ignore"}
-
-    try:
-        job = SafeMigrationJob(**safe_dict)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to parse job: {e}")
-
-    # 5️⃣ Set running state
+    # 2️⃣ Set running state (mutates the stored model in place)
     job.started_at = datetime.now(timezone.utc)
     job.status = "running"
 
-    # 6️⃣ Update in-memory job
-    for i, j in enumerate(migration_jobs_memory):
-        if j["id"] == job_id:
-            migration_jobs_memory[i] = job.model_dump(exclude_unset=False)
-
-    # 7️⃣ Background task
-    async def run_task(job_obj: SafeMigrationJob):
+    # 3️⃣ Background task
+    async def run_task(job_obj: MigrationJob):
         try:
             await asyncio.sleep(3)  # simulate migration
             job_obj.status = "completed"
@@ -207,10 +207,6 @@ async def start_migration(job_id: str, background_tasks: BackgroundTasks):
             job_obj.status = "failed"
             job_obj.completed_at = datetime.now(timezone.utc)
             job_obj.errors.append(str(e))
-        finally:
-            for i, j in enumerate(migration_jobs_memory):
-                if j["id"] == job_obj.id:
-                    migration_jobs_memory[i] = job_obj.model_dump(exclude_unset=False)
 
     background_tasks.add_task(run_task, job)
 
@@ -268,25 +264,19 @@ async def get_mock_edge_export():
 @api_router.get("/edge/real-export")
 async def get_real_edge_export():
     """Get real Edge export data from uploaded files"""
-    from utils.edge_data_parser import EdgeDataParser
-    parser = EdgeDataParser()
-    return parser.parse_all()
+    return _parse_edge_data()
 
 @api_router.get("/edge/summary")
 async def get_edge_summary():
     """Get summary of Edge resources"""
-    from utils.edge_data_parser import EdgeDataParser
     parser = EdgeDataParser()
     return parser.get_summary()
 
 @api_router.get("/edge/assessment")
 async def get_edge_assessment():
     """Get migration assessment for Edge resources"""
-    from utils.edge_data_parser import EdgeDataParser
-    from migration.dependency_analyzer import DependencyAnalyzer
     
-    parser = EdgeDataParser()
-    edge_data = parser.parse_all()
+    edge_data = _parse_edge_data()
     
     # Perform assessment
     assessor = MigrationAssessment()
@@ -294,7 +284,7 @@ async def get_edge_assessment():
     
     # Add dependency analysis
     dep_analyzer = DependencyAnalyzer()
-    dependencies = dep_analyzer.analyze_dependencies(edge_data)
+    dependencies = await asyncio.to_thread(_analyze_dependencies, edge_data)
     assessment["dependencies"] = dependencies
     assessment["migration_order"] = dep_analyzer.get_migration_order(dependencies)
     
@@ -302,6 +292,39 @@ async def get_edge_assessment():
 
 # === Apigee X Configuration Routes ===
 
+@functools.lru_cache(maxsize=256)
+def _abspath(path: str) -> str:
+    return os.path.abspath(path)
+
+def _resolve_folder_name(folder_name: Optional[str]) -> str:
+    """Absolute Edge export folder for a config, defaulting to DEFAULT_FOLDER_NAME"""
+    if folder_name is None:
+        return DEFAULT_FOLDER_NAME
+    return _abspath(folder_name)
+
+@functools.lru_cache(maxsize=64)
+def _cached_migrator(config_key: Tuple[Tuple[str, Any], ...]) -> ApigeeXMigrator:
+    return ApigeeXMigrator(dict(config_key))
+
+def _get_migrator(config: Dict[str, Any]) -> ApigeeXMigrator:
+    """Reuse one ApigeeXMigrator per distinct config instead of rebuilding it per request"""
+    config_key = tuple(sorted((k, v) for k, v in config.items() if isinstance(v, (str, int, bool))))
+    return _cached_migrator(config_key)
+
+async def _find_saved_config() -> Optional[Dict[str, Any]]:
+    """Fetch the saved Apigee X configuration from MongoDB via the TTL cache"""
+    now = time.monotonic()
+    if _config_cache["expires_at"] <= now:
+        generation = _config_cache["generation"]
+        config = await db.apigee_x_config.find_one({}, _CONFIG_PROJECTION)
+        if _config_cache["generation"] == generation:
+            _config_cache["config"] = config
+            _config_cache["expires_at"] = now + _CONFIG_CACHE_TTL
+    else:
+        config = _config_cache["config"]
+    # Hand out a copy; callers fill in defaults on the returned dict
+    return dict(config) if config else None
+
 @api_router.post("/config/apigee-x")
 async def save_apigee_x_config(config: Dict[str, Any]):
     """Save Apigee X configuration"""
@@ -313,34 +336,33 @@ async def save_apigee_x_config(config: Dict[str, Any]):
                 raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
         
         # Add default management URL if not provided
-        if "apigeex_mgmt_url" not in config:
-            config["apigeex_mgmt_url"] = "https://apigee.googleapis.com/v1/organizations/"
-        
-        # Add folder name
-        base_dir = os.path.dirname(os.path.abspath(__file__))  # current script directory
-        default_folder = os.path.join(base_dir, "backend", "data_edge")
+        config.setdefault("apigeex_mgmt_url", DEFAULT_MGMT_URL)
         
         # Use provided folder_name or fallback to default
-        folder_name = config.get("folder_name", default_folder)
-        folder_name = os.path.abspath(folder_name)  # ensure absolute path
-        config["folder_name"] = folder_name
+        config["folder_name"] = _resolve_folder_name(config.get("folder_name"))
         
         # Verify credentials
-        migrator = ApigeeXMigrator(config)
-        success, message = migrator.verify_credentials()
+        migrator = _get_migrator(config)
+        success, message = await asyncio.to_thread(migrator.verify_credentials)
         
         if not success:
             raise HTTPException(status_code=401, detail=message)
         
         # Save to database if available
         if db is not None:
-            await db.apigee_x_config.delete_many({})  # Remove old configs
             config_doc = {
                 **config,
                 "created_at": datetime.now(timezone.utc).isoformat(),
                 "verified": True
             }
-            await db.apigee_x_config.insert_one(config_doc)
+            # Single upsert replaces the old config in one round-trip
+            await db.apigee_x_config.replace_one({}, config_doc, upsert=True)
+            # Cache what was just saved, as find_one would return it
+            _config_cache.update(
+                config={k: config_doc[k] for k in _CONFIG_PROJECTION if k in config_doc},
+                expires_at=time.monotonic() + _CONFIG_CACHE_TTL,
+                generation=_config_cache["generation"] + 1,
+            )
         else:
             # Store in memory if no database
             global _in_memory_config
@@ -357,14 +379,14 @@ async def save_apigee_x_config(config: Dict[str, Any]):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to save config: {str(e)}")
+        logger.error("Failed to save config: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.get("/config/apigee-x")
 async def get_apigee_x_config():
     """Get saved Apigee X configuration (without sensitive token)"""
     if db is not None:
-        config = await db.apigee_x_config.find_one({}, {"_id": 0})
+        config = await _find_saved_config()
     else:
         global _in_memory_config
         config = _in_memory_config
@@ -387,18 +409,12 @@ async def get_apigee_x_config():
 async def verify_apigee_x_credentials(config: Dict[str, Any]):
     """Verify Apigee X credentials without saving"""
     try:
-        if "apigeex_mgmt_url" not in config:
-            config["apigeex_mgmt_url"] = "https://apigee.googleapis.com/v1/organizations/"
-        base_dir = os.path.dirname(os.path.abspath(__file__))  # current script directory
-        default_folder = os.path.join(base_dir, "backend", "data_edge")
-        
+        config.setdefault("apigeex_mgmt_url", DEFAULT_MGMT_URL)
         # Use provided folder_name or fallback to default
-        folder_name = config.get("folder_name", default_folder)
-        folder_name = os.path.abspath(folder_name)  # ensure absolute path
-        config["folder_name"] = folder_name
+        config["folder_name"] = _resolve_folder_name(config.get("folder_name"))
         
-        migrator = ApigeeXMigrator(config)
-        success, message = migrator.verify_credentials()
+        migrator = _get_migrator(config)
+        success, message = await asyncio.to_thread(migrator.verify_credentials)
         
         return {
             "success": success,
@@ -415,30 +431,25 @@ async def verify_apigee_x_credentials(config: Dict[str, Any]):
 @api_router.get("/discover/real")
 async def discover_real_resources():
     """Discover all resources from the Edge data folder"""
-    from utils.edge_data_parser import EdgeDataParser
     
     try:
-        parser = EdgeDataParser()
-        resources = parser.parse_all()
+        resources = _parse_edge_data()
         
         return {
             "success": True,
             "resources": resources,
-            "summary": parser.get_summary()
+            "summary": EdgeDataParser.summarize(resources)
         }
     except Exception as e:
-        logger.error(f"Discovery failed: {str(e)}")
+        logger.error("Discovery failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.post("/assess")
 async def assess_resources():
     """Perform migration assessment with dependency analysis"""
-    from utils.edge_data_parser import EdgeDataParser
-    from migration.dependency_analyzer import DependencyAnalyzer
     
     try:
-        parser = EdgeDataParser()
-        edge_data = parser.parse_all()
+        edge_data = _parse_edge_data()
         
         # Perform assessment
         assessor = MigrationAssessment()
@@ -446,7 +457,7 @@ async def assess_resources():
         
         # Add dependency analysis
         dep_analyzer = DependencyAnalyzer()
-        dependencies = dep_analyzer.analyze_dependencies(edge_data)
+        dependencies = await asyncio.to_thread(_analyze_dependencies, edge_data)
         assessment["dependencies"] = dependencies
         assessment["migration_order"] = dep_analyzer.get_migration_order(dependencies)
         
@@ -455,21 +466,18 @@ async def assess_resources():
             "assessment": assessment
         }
     except Exception as e:
-        logger.error(f"Assessment failed: {str(e)}")
+        logger.error("Assessment failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.get("/dependencies")
 async def get_dependencies():
     """Get dependency graph for all resources"""
-    from utils.edge_data_parser import EdgeDataParser
-    from migration.dependency_analyzer import DependencyAnalyzer
     
     try:
-        parser = EdgeDataParser()
-        edge_data = parser.parse_all()
+        edge_data = _parse_edge_data()
         
         dep_analyzer = DependencyAnalyzer()
-        dependencies = dep_analyzer.analyze_dependencies(edge_data)
+        dependencies = await asyncio.to_thread(_analyze_dependencies, edge_data)
         migration_order = dep_analyzer.get_migration_order(dependencies)
         
         return {
@@ -478,121 +486,112 @@ async def get_dependencies():
             "migration_order": migration_order
         }
     except Exception as e:
-        logger.error(f"Dependency analysis failed: {str(e)}")
+        logger.error("Dependency analysis failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # === Real Migration Routes ===
 
-@api_router.post("/migrate/resource")
-async def migrate_single_resource(payload: Dict[str, Any]):
-    """Migrate a single resource using real Apigee X APIs"""
-
-    try:
-        # ======================================================
-        # 1. LOAD CONFIG FROM DB (IF DB IS ENABLED)
-        # ======================================================
-        config = None
-        if db is not None:
-            try:
-                config = await db.apigee_x_config.find_one({}, {"_id": 0})
-            except Exception:
-                config = None  # DB not available
+# Accepted resource_type spellings → canonical migrator type
+RESOURCE_TYPE_ALIASES = MappingProxyType({
+    "target_server": "targetserver",
+    "targetserver": "targetserver",
+    "proxy": "proxy",
+    "shared_flow": "sharedflow",
+    "sharedflow": "sharedflow",
+    "kvm": "kvm",
+    "api_product": "apiproduct",
+    "apiproduct": "apiproduct",
+    "developer": "developer",
+    "app": "app"
+})
+
+# Canonical type → call into ApigeeXMigrator as (migrator, resource_name, payload)
+RESOURCE_MIGRATORS = MappingProxyType({
+    "targetserver": lambda m, name, payload: m.migrate_target_server(name),
+    "kvm": lambda m, name, payload: m.migrate_kvm(name, payload.get("scope", "env")),
+    "developer": lambda m, name, payload: m.migrate_developer(name),
+    "apiproduct": lambda m, name, payload: m.migrate_product(name),
+    "app": lambda m, name, payload: m.migrate_app(name),
+    "proxy": lambda m, name, payload: m.migrate_proxy(name.removesuffix(".zip")),
+    "sharedflow": lambda m, name, payload: m.migrate_sharedflow(name.removesuffix(".zip")),
+})
+
+async def _load_migration_config(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve and validate the Apigee X config for a migration request"""
+    # ======================================================
+    # 1. LOAD CONFIG FROM DB (IF DB IS ENABLED)
+    # ======================================================
+    config = None
+    if db is not None:
+        try:
+            config = await _find_saved_config()
+        except Exception:
+            config = None  # DB not available
 
-        # ======================================================
-        # 2. FALLBACK: LOAD CONFIG FROM UI PAYLOAD
-        # ======================================================
-        if not config:
-            config = payload.get("apigee_x_config")
+    # ======================================================
+    # 2. FALLBACK: LOAD CONFIG FROM UI PAYLOAD
+    # ======================================================
+    if not config:
+        config = payload.get("apigee_x_config")
 
-        # ======================================================
-        # 3. STILL MISSING? THROW ERROR
-        # ======================================================
-        if not config:
+    # ======================================================
+    # 3. STILL MISSING? THROW ERROR
+    # ======================================================
+    if not config:
+        raise HTTPException(
+            status_code=400, 
+            detail="Apigee X configuration not found. Provide it in UI or save via /config/apigee-x."
+        )
+
+    # ======================================================
+    # 4. ENSURE REQUIRED CONFIG FIELDS ARE PRESENT
+    # ======================================================
+    required = ["apigeex_org_name", "apigeex_env", "apigeex_token"]
+    for r in required:
+        if r not in config:
             raise HTTPException(
                 status_code=400, 
-                detail="Apigee X configuration not found. Provide it in UI or save via /config/apigee-x."
+                detail=f"Missing required config field: {r}"
             )
 
-        # ======================================================
-        # 4. ENSURE REQUIRED CONFIG FIELDS ARE PRESENT
-        # ======================================================
-        required = ["apigeex_org_name", "apigeex_env", "apigeex_token"]
-        for r in required:
-            if r not in config:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Missing required config field: {r}"
-                )
-
-        # Add default mgmt URL if missing
-        if "apigeex_mgmt_url" not in config:
-            config["apigeex_mgmt_url"] = "https://apigee.googleapis.com/v1/organizations/"
+    # Add default mgmt URL if missing
+    config.setdefault("apigeex_mgmt_url", DEFAULT_MGMT_URL)
+
+    return config
+
+@api_router.post("/migrate/resource")
+async def migrate_single_resource(payload: Dict[str, Any]):
+    """Migrate a single resource using real Apigee X APIs"""
+
+    try:
+        config = await _load_migration_config(payload)
 
         # ======================================================
-        # 5. PROCESS RESOURCE MIGRATION
+        # PROCESS RESOURCE MIGRATION
         # ======================================================
-        resource_type = payload.get("resource_type")
+        raw_type = payload.get("resource_type")
         resource_name = payload.get("resource_name")
 
-        normalize_map = {
-            "target_server": "targetserver",
-            "targetserver": "targetserver",
-            "proxy": "proxy",
-            "shared_flow": "sharedflow",
-            "sharedflow": "sharedflow",
-            "kvm": "kvm",
-            "api_product": "apiproduct",
-            "apiproduct": "apiproduct",
-            "developer": "developer",
-            "app": "app"
-        }
-
-        raw_type = resource_type
-        resource_type = normalize_map.get(raw_type)
+        migrate = RESOURCE_MIGRATORS.get(RESOURCE_TYPE_ALIASES.get(raw_type))
 
-        if not resource_type:
+        if migrate is None:
             raise HTTPException(
                 status_code=400, 
                 detail=f"Unsupported resource type: {raw_type}"
             )
 
-        if not resource_type or not resource_name:
+        if not resource_name:
             raise HTTPException(status_code=400, detail="resource_type and resource_name are required")
 
-        migrator = ApigeeXMigrator(config)
-
-        if resource_type == "targetserver":
-            result = migrator.migrate_target_server(resource_name)
-
-        elif resource_type == "kvm":
-            scope = payload.get("scope", "env")
-            result = migrator.migrate_kvm(resource_name, scope)
-
-        elif resource_type == "developer":
-            result = migrator.migrate_developer(resource_name)
-
-        elif resource_type == "apiproduct":
-            result = migrator.migrate_product(resource_name)
-
-        elif resource_type == "app":
-            result = migrator.migrate_app(resource_name)
-
-        elif resource_type == "proxy":
-            result = migrator.migrate_proxy(resource_name.replace(".zip", ""))
-
-        elif resource_type == "sharedflow":
-            result = migrator.migrate_sharedflow(resource_name.replace(".zip", ""))
-
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported resource type: {resource_type}")
-
-        return result
+        migrator = _get_migrator(config)
+        # Migrator calls are blocking HTTP requests; keep them off the event loop
+        return await asyncio.to_thread(migrate, migrator, resource_name, payload)
 
     except HTTPException:
         raise
 
     except Exception as e:
-        logging.error(f"Migration failed: {str(e)}")
+        logger.error("Migration failed: %s", e)
         return {
             "success": False,
             "resource_type": payload.get("resource_type"),
@@ -600,31 +599,39 @@ async def migrate_single_resource(payload: Dict[str, Any]):
             "message": str(e)
         }
 
+# Mock resource type → MockDataGenerator method producing it
+MOCK_RESOURCE_GENERATORS = MappingProxyType({
+    "proxies": "generate_proxies",
+    "shared_flows": "generate_shared_flows",
+    "target_servers": "generate_target_servers",
+    "kvms": "generate_kvms",
+    "api_products": "generate_api_products",
+    "developers": "generate_developers",
+    "developer_apps": "generate_developer_apps",
+})
+
+@functools.lru_cache(maxsize=None)
+def _mock_resources_json(resource_type: str) -> bytes:
+    """Serialized mock resources, generated once per type and reused"""
+    generate = getattr(MockDataGenerator(), MOCK_RESOURCE_GENERATORS[resource_type])
+    return orjson.dumps([item.model_dump(mode="json") for item in generate()])
+
 @api_router.get("/mock/resources/{resource_type}")
 async def get_mock_resources(resource_type: str):
     """Get mock resources of a specific type"""
-    generator = MockDataGenerator()
-    
-    if resource_type == "proxies":
-        return [p.model_dump() for p in generator.generate_proxies()]
-    elif resource_type == "shared_flows":
-        return [sf.model_dump() for sf in generator.generate_shared_flows()]
-    elif resource_type == "target_servers":
-        return [ts.model_dump() for ts in generator.generate_target_servers()]
-    elif resource_type == "kvms":
-        return [kvm.model_dump() for kvm in generator.generate_kvms()]
-    elif resource_type == "api_products":
-        return [ap.model_dump() for ap in generator.generate_api_products()]
-    elif resource_type == "developers":
-        return [d.model_dump() for d in generator.generate_developers()]
-    elif resource_type == "developer_apps":
-        return [da.model_dump() for da in generator.generate_developer_apps()]
-    else:
+    if resource_type not in MOCK_RESOURCE_GENERATORS:
         raise HTTPException(status_code=404, detail="Resource type not found")
+    
+    return Response(content=_mock_resources_json(resource_type), media_type="application/json")
 
 
 # === Diff & Comparison Routes ===
 
+_diff_calculator = DiffCalculator()
+# Recent diff results keyed by a digest of the compared resources (LRU)
+_DIFF_CACHE_SIZE = 512
+_diff_cache: "OrderedDict[Tuple[bytes, str, str], Dict[str, Any]]" = OrderedDict()
+
 @api_router.post("/diff/calculate")
 async def calculate_diff(payload: Dict[str, Any]):
     """Calculate differences between Edge and X resources"""
@@ -633,20 +640,36 @@ async def calculate_diff(payload: Dict[str, Any]):
     resource_type = payload.get("resource_type", "unknown")
     resource_name = payload.get("resource_name", "unknown")
     
-    calculator = DiffCalculator()
-    diff = calculator.calculate_diff(edge_resource, x_resource, resource_type, resource_name)
+    digest = hashlib.blake2b(
+        orjson.dumps([edge_resource, x_resource], option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).digest()
+    key = (digest, resource_type, resource_name)
+    cached = _diff_cache.get(key)
+    if cached is not None:
+        _diff_cache.move_to_end(key)
+        return cached
+    
+    diff = _diff_calculator.calculate_diff(edge_resource, x_resource, resource_type, resource_name).model_dump()
+    _diff_cache[key] = diff
+    if len(_diff_cache) > _DIFF_CACHE_SIZE:
+        _diff_cache.popitem(last=False)
     
-    return diff.model_dump()
+    return diff
 
 # Include the router in the main app
 app.include_router(api_router)
 
+# CORSMiddleware answers preflight (OPTIONS) requests itself; no route needed
+origins_list = [o.strip() for o in os.environ.get('CORS_ORIGINS', '*').split(',') if o.strip()]
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+    allow_origins=origins_list,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=3600,  # let browsers cache preflight responses for an hour
 )
 
 # Configure logging
@@ -661,6 +684,24 @@ from contextlib import asynccontextmanager
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global client, db
+    if client:
+        try:
+            await client.server_info()  # Test the connection
+            print("✓ MongoDB connected")
+        except Exception as e:
+            print(f"⚠ MongoDB not available: {e}")
+            print("⚠ Running in no-database mode (configuration will not persist)")
+            client.close()
+            client = None
+            db = None
+    if client:
+        # Only speeds up the status listing; a working connection is kept
+        # even when the index cannot be created
+        try:
+            await db.status_checks.create_index("timestamp")
+        except Exception as e:
+            print(f"⚠ Could not create status_checks index: {e}")
     yield
     if client:
         client.close()
@@ -670,11 +711,18 @@ app.router.lifespan_context = lifespan
 # --- START SERVER ---
 if __name__ == "__main__":
     PORT = int(os.environ.get("PORT", 8080))
+    # Migration jobs live in process memory, so default to a single worker;
+    # raise WEB_CONCURRENCY only once job state is moved to the database
+    WORKERS = int(os.environ.get("WEB_CONCURRENCY", 1))
 
     uvicorn.run(
         "server:app",
         host="0.0.0.0",
         port=PORT,
+        # "auto" picks uvloop/httptools when installed and falls back to
+        # asyncio/h11 where they aren't (uvloop has no Windows build)
+        loop="auto",
+        http="auto",
         reload=False,   # VERY IMPORTANT
-        workers=1
+        workers=WORKERS
     )
\ No newline at end of file
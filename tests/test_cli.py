@@ -0,0 +1,24 @@
+"""Tests for the migration CLI"""
+import json
+
+from typer.testing import CliRunner
+
+import cli
+
+
+def test_full_migrate_output_has_log_arrays(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+
+    result = runner.invoke(cli.app, ["generate-config", "--output", "config.json"])
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(cli.app, ["full-migrate", "-c", "config.json", "--dry-run", "-o", "result.json"])
+    assert result.exit_code == 0, result.output
+
+    with open("result.json") as f:
+        saved = json.load(f)
+    for field in ("logs", "errors", "warnings"):
+        assert isinstance(saved[field], list)
+    assert saved["logs"]
+    assert all(isinstance(line, str) for line in saved["logs"])
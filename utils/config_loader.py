@@ -1,10 +1,68 @@
 """Configuration loader for migration settings"""
-import json
-import yaml
+import copy
+import functools
+import orjson
 from pathlib import Path
-from typing import Dict, Any, Optional
-from models.edge_models import EdgeOrgConfig
-from models.apigee_x_models import ApigeeXConfig
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
+
+# PyYAML and the pydantic models are imported on first use so that JSON-only
+# callers do not pay for them at import time
+if TYPE_CHECKING:
+    from models.edge_models import EdgeOrgConfig
+    from models.apigee_x_models import ApigeeXConfig
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_codec() -> Tuple[Any, Any, Any]:
+    """(yaml module, loader, dumper), preferring the LibYAML-backed C loader/dumper"""
+    import yaml
+    if getattr(yaml, "__with_libyaml__", False):
+        return yaml, yaml.CSafeLoader, yaml.CSafeDumper
+    return yaml, yaml.SafeLoader, yaml.SafeDumper
+
+
+# Parsed config files: absolute path -> (mtime in ns, parsed config)
+_config_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+# Built once; create_default_config hands out deep copies
+_DEFAULT_CONFIG_TEMPLATE: Dict[str, Any] = {
+    "edge": {
+        "name": "demo-edge-org",
+        "base_url": "https://api.enterprise.apigee.com",
+        "username": "your-username",
+        "password": "your-password",
+        "environments": ["prod", "test"]
+    },
+    "apigee_x": {
+        "project_id": "your-gcp-project",
+        "organization": "your-apigee-x-org",
+        "location": "us-central1",
+        "service_account_key_path": "/path/to/service-account-key.json",
+        "environments": ["prod", "test"]
+    },
+    "migration": {
+        "batch_size": 10,
+        "parallel_imports": True,
+        "max_workers": 5,
+        "dry_run": False,
+        "resource_types": [
+            "proxies",
+            "shared_flows",
+            "target_servers",
+            "kvms",
+            "api_products",
+            "developers",
+            "developer_apps"
+        ]
+    },
+    "transformations": {
+        "remove_unsupported_policies": True,
+        "convert_java_callouts": True,
+        "update_target_servers": True,
+        "preserve_revision_history": True
+    }
+}
 
 
 class ConfigLoader:
@@ -12,82 +70,62 @@ class ConfigLoader:
     
     @staticmethod
     def load_config(config_path: str) -> Dict[str, Any]:
-        """Load configuration from JSON or YAML file"""
-        path = Path(config_path)
+        """Load configuration from JSON or YAML file, reusing the parsed result until the file changes"""
+        path = Path(config_path).resolve()
         
-        if not path.exists():
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f"Config file not found: {config_path}")
         
-        with open(path, 'r') as f:
+        cached = _config_cache.get(str(path))
+        if cached is not None and cached[0] == mtime:
+            config_data = cached[1]
+        else:
             if path.suffix == '.json':
-                return json.load(f)
+                with open(path, 'rb') as f:
+                    config_data = orjson.loads(f.read())
             elif path.suffix in ['.yaml', '.yml']:
-                return yaml.safe_load(f)
+                yaml, loader, _ = _yaml_codec()
+                with open(path, 'r') as f:
+                    config_data = yaml.load(f, Loader=loader)
             else:
                 raise ValueError(f"Unsupported config file format: {path.suffix}")
+            _config_cache[str(path)] = (mtime, config_data)
+        
+        # Callers get their own copy so the cached parse stays pristine
+        return copy.deepcopy(config_data)
     
     @staticmethod
-    def load_edge_config(config_data: Dict[str, Any]) -> EdgeOrgConfig:
+    def load_edge_config(config_data: Dict[str, Any]) -> "EdgeOrgConfig":
         """Load Edge configuration"""
+        from models.edge_models import EdgeOrgConfig
         edge_config = config_data.get('edge', {})
         return EdgeOrgConfig(**edge_config)
     
     @staticmethod
-    def load_apigee_x_config(config_data: Dict[str, Any]) -> ApigeeXConfig:
+    def load_apigee_x_config(config_data: Dict[str, Any]) -> "ApigeeXConfig":
         """Load Apigee X configuration"""
+        from models.apigee_x_models import ApigeeXConfig
         x_config = config_data.get('apigee_x', {})
         return ApigeeXConfig(**x_config)
     
     @staticmethod
     def create_default_config() -> Dict[str, Any]:
         """Create a default configuration template"""
-        return {
-            "edge": {
-                "name": "demo-edge-org",
-                "base_url": "https://api.enterprise.apigee.com",
-                "username": "your-username",
-                "password": "your-password",
-                "environments": ["prod", "test"]
-            },
-            "apigee_x": {
-                "project_id": "your-gcp-project",
-                "organization": "your-apigee-x-org",
-                "location": "us-central1",
-                "service_account_key_path": "/path/to/service-account-key.json",
-                "environments": ["prod", "test"]
-            },
-            "migration": {
-                "batch_size": 10,
-                "parallel_imports": True,
-                "max_workers": 5,
-                "dry_run": False,
-                "resource_types": [
-                    "proxies",
-                    "shared_flows",
-                    "target_servers",
-                    "kvms",
-                    "api_products",
-                    "developers",
-                    "developer_apps"
-                ]
-            },
-            "transformations": {
-                "remove_unsupported_policies": True,
-                "convert_java_callouts": True,
-                "update_target_servers": True,
-                "preserve_revision_history": True
-            }
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
     
     @staticmethod
     def save_config(config_data: Dict[str, Any], output_path: str):
         """Save configuration to file"""
         path = Path(output_path)
         
-        with open(path, 'w') as f:
-            if path.suffix == '.json':
-                json.dump(config_data, f, indent=2)
-            elif path.suffix in ['.yaml', '.yml']:
-                yaml.dump(config_data, f, default_flow_style=False)
-            else:
-                raise ValueError(f"Unsupported config file format: {path.suffix}")
+        if path.suffix == '.json':
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        elif path.suffix in ['.yaml', '.yml']:
+            yaml, _, dumper = _yaml_codec()
+            with open(path, 'w') as f:
+                yaml.dump(config_data, f, Dumper=dumper, default_flow_style=False)
+        else:
+            raise ValueError(f"Unsupported config file format: {path.suffix}")
@@ -11,19 +11,28 @@ class DiffCalculator:
         """Calculate differences between Edge and X resources"""
         differences = []
         
-        # Compare common fields
-        all_keys = set(edge_resource.keys()) | set(x_resource.keys())
-        
-        for key in all_keys:
-            edge_value = edge_resource.get(key)
+        # Fields present in Edge (missing on the X side reads as None)
+        for key, edge_value in edge_resource.items():
             x_value = x_resource.get(key)
             
             if edge_value != x_value:
+                # Values differ, so at most one side can be None
                 differences.append({
                     "field": key,
                     "edge_value": edge_value,
                     "x_value": x_value,
-                    "change_type": DiffCalculator._get_change_type(edge_value, x_value)
+                    "change_type": "added" if edge_value is None else "removed" if x_value is None else "modified"
+                })
+        
+        # Fields only present in Apigee X; an explicit None matches a missing field
+        for key in x_resource.keys() - edge_resource.keys():
+            x_value = x_resource[key]
+            if x_value is not None:
+                differences.append({
+                    "field": key,
+                    "edge_value": None,
+                    "x_value": x_value,
+                    "change_type": "added"
                 })
         
         # Determine overall status
@@ -39,23 +48,17 @@ class DiffCalculator:
             status=status
         )
     
-    @staticmethod
-    def _get_change_type(edge_value: Any, x_value: Any) -> str:
-        """Determine the type of change"""
-        if edge_value is None and x_value is not None:
-            return "added"
-        elif edge_value is not None and x_value is None:
-            return "removed"
-        else:
-            return "modified"
-    
     @staticmethod
     def calculate_policy_diff(edge_policies: List[Dict[str, Any]], x_policies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Calculate differences in policies"""
         differences = []
         
-        edge_policy_names = {p.get("name") for p in edge_policies}
-        x_policy_names = {p.get("name") for p in x_policies}
+        # Index policies by name; built in reverse so the first policy wins
+        # for duplicate names
+        edge_by_name = {p.get("name"): p for p in reversed(edge_policies)}
+        x_by_name = {p.get("name"): p for p in reversed(x_policies)}
+        edge_policy_names = edge_by_name.keys()
+        x_policy_names = x_by_name.keys()
         
         # Find added policies
         added = x_policy_names - edge_policy_names
@@ -78,8 +81,8 @@ class DiffCalculator:
         # Find modified policies
         common = edge_policy_names & x_policy_names
         for policy_name in common:
-            edge_policy = next((p for p in edge_policies if p.get("name") == policy_name), None)
-            x_policy = next((p for p in x_policies if p.get("name") == policy_name), None)
+            edge_policy = edge_by_name[policy_name]
+            x_policy = x_by_name[policy_name]
             
             if edge_policy and x_policy and edge_policy.get("type") != x_policy.get("type"):
                 differences.append({
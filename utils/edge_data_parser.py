@@ -1,12 +1,121 @@
 """Parser for real Apigee Edge exported data"""
-import json
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any, Tuple
 import logging
+import re
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# One worker per resource type for parse_all, and a wider pool for the
+# per-file JSON reads, which are IO bound
+_PARSE_POOL = ThreadPoolExecutor(max_workers=7)
+_FILE_POOL = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4)
+
+# Leading markup of an XML document; only element tags capture a name
+_XML_TAG_RE = re.compile(rb'<!--.*?-->|<\?.*?\?>|<![^>]*>|<([A-Za-z_][\w:.-]*)', re.DOTALL)
+
+# Resource folders read by parse_all, relative to the data directory
+_RESOURCE_DIRS = ("proxies", "sharedflows", "developers", "apps", "apiproducts", "targetservers", "keyvaluemaps")
+
+# parse_all results per data directory: path -> (folder signature, parsed export)
+_parse_cache: Dict[str, Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
+
+
+def _iter_files(directory) -> Iterator[os.DirEntry]:
+    """Yield regular file entries of a directory using the cached dirent type"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                yield entry
+
+
+def _iter_dirs(directory) -> Iterator[os.DirEntry]:
+    """Yield sub-directory entries of a directory using the cached dirent type"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield entry
+
+
+def _iter_xml(directory: str) -> Iterator[os.DirEntry]:
+    """Yield the *.xml entries of a directory; a missing directory yields nothing"""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".xml"):
+                    yield entry
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+
+def _count_entries(directory, suffix: str) -> int:
+    """Number of entries named *suffix in a directory; 0 if it is missing"""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(suffix))
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
+def _count_files(directory) -> int:
+    """Number of regular files in a directory; 0 if it is missing"""
+    try:
+        return sum(1 for _ in _iter_files(directory))
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
+def _count_env_files(directory) -> int:
+    """Number of regular files across the per-environment sub-directories"""
+    try:
+        return sum(_count_files(env_dir.path) for env_dir in _iter_dirs(directory))
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
+def _tree_signature(directory: str) -> Tuple[Tuple[str, int, int, int], ...]:
+    """(path, mtime, ctime, size) of every entry in a folder tree, in sorted walk order"""
+    # Every file is compared, not just the newest mtime: unzip/cp -p/rsync -t
+    # restore an older export's mtimes (but cannot set ctime), and an in-place
+    # overwrite leaves the parent directory's mtime untouched
+    signature = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        files.sort()
+        for path in (root, *(os.path.join(root, name) for name in files)):
+            try:
+                st = os.stat(path)
+            except OSError:
+                # Dangling symlink or removed mid-walk; the parsers skip it too
+                continue
+            signature.append((path, st.st_mtime_ns, st.st_ctime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path, 'rb') as f:
+        data = orjson.loads(f.read())
+    # Every Edge resource file is a single object; reject anything else here
+    # so it is reported alongside unreadable JSON
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+    return data
+
+
+def _log_failures(kind: str, failures: List[Tuple[str, Exception]]) -> None:
+    """Report every unreadable file of one resource type in a single log record"""
+    if failures:
+        logger.error("Failed to parse %d %s file(s): %s", len(failures), kind,
+                     "; ".join(f"{path}: {e}" for path, e in failures))
+
+
+def _load_json_files(entries: Iterable[os.DirEntry]) -> List[Tuple[os.DirEntry, Future]]:
+    """Start reading every JSON file and return (entry, future) pairs in order"""
+    return [(entry, _FILE_POOL.submit(_read_json, entry.path)) for entry in entries]
+
 
 class EdgeDataParser:
     """Parse exported Apigee Edge data from directory structure"""
@@ -19,60 +128,71 @@ class EdgeDataParser:
         self.data_dir = Path(data_dir)
         
     def parse_all(self) -> Dict[str, Any]:
-        """Parse all Edge resources from the data directory"""
-        return {
-            "proxies": self.parse_proxies(),
-            "shared_flows": self.parse_shared_flows(),
-            "developers": self.parse_developers(),
-            "apps": self.parse_apps(),
-            "api_products": self.parse_api_products(),
-            "target_servers": self.parse_target_servers(),
-            "kvms": self.parse_kvms()
+        """Parse all Edge resources from the data directory, reusing the last result until a resource folder changes"""
+        key = str(self.data_dir)
+        signature = tuple(_tree_signature(os.path.join(key, name)) for name in _RESOURCE_DIRS)
+        cached = _parse_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        # The resource types are independent, so scan them concurrently
+        futures = {
+            "proxies": _PARSE_POOL.submit(self.parse_proxies),
+            "shared_flows": _PARSE_POOL.submit(self.parse_shared_flows),
+            "developers": _PARSE_POOL.submit(self.parse_developers),
+            "apps": _PARSE_POOL.submit(self.parse_apps),
+            "api_products": _PARSE_POOL.submit(self.parse_api_products),
+            "target_servers": _PARSE_POOL.submit(self.parse_target_servers),
+            "kvms": _PARSE_POOL.submit(self.parse_kvms)
         }
+        data = {resource_type: future.result() for resource_type, future in futures.items()}
+        _parse_cache[key] = (signature, data)
+        return data
     
     def parse_proxies(self) -> List[Dict[str, Any]]:
         """Parse API proxies"""
         proxies = []
         proxies_dir = self.data_dir / "proxies"
         
-        if not proxies_dir.exists():
+        # One scan of the folder gives both the bundles and the extracted dirs
+        try:
+            with os.scandir(proxies_dir) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError):
             return proxies
+        extracted = {entry.name for entry in entries if entry.is_dir()}
         
-        # Find all .zip files
-        for zip_file in proxies_dir.glob("*.zip"):
-            proxy_name = zip_file.stem
-            proxy_dir = proxies_dir / proxy_name
+        for zip_file in entries:
+            if not zip_file.name.endswith(".zip"):
+                continue
+            proxy_name = zip_file.name.removesuffix(".zip")
             
             proxy_data = {
                 "name": proxy_name,
                 "type": "API Proxy",
-                "bundle_path": str(zip_file),
+                "bundle_path": zip_file.path,
                 "policies": [],
                 "targets": [],
                 "endpoints": []
             }
             
-            # Parse proxy details if directory exists
-            if proxy_dir.exists():
+            # Parse proxy details if the extracted directory exists
+            if proxy_name in extracted:
+                bundle_dir = os.path.join(zip_file.path.removesuffix(".zip"), "apiproxy")
+                
                 # Parse policies
-                policies_dir = proxy_dir / "apiproxy" / "policies"
-                if policies_dir.exists():
-                    for policy_file in policies_dir.glob("*.xml"):
-                        policy_data = self._parse_policy(policy_file)
-                        if policy_data:
-                            proxy_data["policies"].append(policy_data)
+                for policy_file in _iter_xml(os.path.join(bundle_dir, "policies")):
+                    policy_data = self._parse_policy(Path(policy_file.path))
+                    if policy_data:
+                        proxy_data["policies"].append(policy_data)
                 
                 # Parse targets
-                targets_dir = proxy_dir / "apiproxy" / "targets"
-                if targets_dir.exists():
-                    for target_file in targets_dir.glob("*.xml"):
-                        proxy_data["targets"].append(target_file.stem)
+                for target_file in _iter_xml(os.path.join(bundle_dir, "targets")):
+                    proxy_data["targets"].append(target_file.name.removesuffix(".xml"))
                 
                 # Parse proxy endpoints
-                proxies_endpoint_dir = proxy_dir / "apiproxy" / "proxies"
-                if proxies_endpoint_dir.exists():
-                    for endpoint_file in proxies_endpoint_dir.glob("*.xml"):
-                        proxy_data["endpoints"].append(endpoint_file.stem)
+                for endpoint_file in _iter_xml(os.path.join(bundle_dir, "proxies")):
+                    proxy_data["endpoints"].append(endpoint_file.name.removesuffix(".xml"))
             
             proxy_data["policy_count"] = len(proxy_data["policies"])
             proxies.append(proxy_data)
@@ -84,9 +204,6 @@ class EdgeDataParser:
         flows = []
         flows_dir = self.data_dir / "sharedflows"
         
-        if not flows_dir.exists():
-            return flows
-        
         for zip_file in flows_dir.glob("*.zip"):
             flow_data = {
                 "name": zip_file.stem,
@@ -100,198 +217,192 @@ class EdgeDataParser:
     def parse_developers(self) -> List[Dict[str, Any]]:
         """Parse developers"""
         developers = []
+        failures = []
         devs_dir = self.data_dir / "developers"
         
-        if not devs_dir.exists():
-            return developers
-        
-        for dev_file in devs_dir.iterdir():
-            if dev_file.is_file():
+        try:
+            for dev_file, pending in _load_json_files(_iter_files(devs_dir)):
                 try:
-                    with open(dev_file, 'r') as f:
-                        dev_data = json.load(f)
-                        developers.append({
-                            "email": dev_data.get("email"),
-                            "firstName": dev_data.get("firstName"),
-                            "lastName": dev_data.get("lastName"),
-                            "userName": dev_data.get("userName"),
-                            "status": dev_data.get("status"),
-                            "developerId": dev_data.get("developerId"),
-                            "organizationName": dev_data.get("organizationName"),
-                            "apps": dev_data.get("apps", []),
-                            "attributes": dev_data.get("attributes", [])
-                        })
+                    dev_data = pending.result()
+                    developers.append({
+                        "email": dev_data.get("email"),
+                        "firstName": dev_data.get("firstName"),
+                        "lastName": dev_data.get("lastName"),
+                        "userName": dev_data.get("userName"),
+                        "status": dev_data.get("status"),
+                        "developerId": dev_data.get("developerId"),
+                        "organizationName": dev_data.get("organizationName"),
+                        "apps": dev_data.get("apps", []),
+                        "attributes": dev_data.get("attributes", [])
+                    })
                 except Exception as e:
-                    logger.error(f"Failed to parse developer {dev_file}: {e}")
-        
+                    failures.append((dev_file.path, e))
+        except FileNotFoundError:
+            # Resource folder not present in this export
+            pass
+
+        _log_failures("developer", failures)
         return developers
     
     def parse_apps(self) -> List[Dict[str, Any]]:
         """Parse developer apps"""
         apps = []
+        failures = []
         apps_dir = self.data_dir / "apps"
         
-        if not apps_dir.exists():
-            return apps
-        
-        for app_file in apps_dir.iterdir():
-            if app_file.is_file():
+        try:
+            for app_file, pending in _load_json_files(_iter_files(apps_dir)):
                 try:
-                    with open(app_file, 'r') as f:
-                        app_data = json.load(f)
-                        
-                        # Extract API products from credentials
-                        api_products = []
-                        credentials = app_data.get("credentials", [])
-                        for cred in credentials:
-                            for prod in cred.get("apiProducts", []):
-                                api_products.append(prod.get("apiproduct"))
-                        
-                        apps.append({
-                            "name": app_data.get("name"),
-                            "appId": app_data.get("appId"),
-                            "developerId": app_data.get("developerId"),
-                            "status": app_data.get("status"),
-                            "callbackUrl": app_data.get("callbackUrl"),
-                            "apiProducts": api_products,
-                            "credentials": len(credentials),
-                            "attributes": app_data.get("attributes", [])
-                        })
+                    app_data = pending.result()
+
+                    # Extract API products from credentials
+                    api_products = []
+                    credentials = app_data.get("credentials", [])
+                    for cred in credentials:
+                        for prod in cred.get("apiProducts", []):
+                            api_products.append(prod.get("apiproduct"))
+
+                    apps.append({
+                        "name": app_data.get("name"),
+                        "appId": app_data.get("appId"),
+                        "developerId": app_data.get("developerId"),
+                        "status": app_data.get("status"),
+                        "callbackUrl": app_data.get("callbackUrl"),
+                        "apiProducts": api_products,
+                        "credentials": len(credentials),
+                        "attributes": app_data.get("attributes", [])
+                    })
                 except Exception as e:
-                    logger.error(f"Failed to parse app {app_file}: {e}")
-        
+                    failures.append((app_file.path, e))
+        except FileNotFoundError:
+            # Resource folder not present in this export
+            pass
+
+        _log_failures("app", failures)
         return apps
     
     def parse_api_products(self) -> List[Dict[str, Any]]:
         """Parse API products"""
         products = []
+        failures = []
         products_dir = self.data_dir / "apiproducts"
         
-        if not products_dir.exists():
-            return products
-        
-        for product_file in products_dir.iterdir():
-            if product_file.is_file():
+        try:
+            for product_file, pending in _load_json_files(_iter_files(products_dir)):
                 try:
-                    with open(product_file, 'r') as f:
-                        prod_data = json.load(f)
-                        products.append({
-                            "name": prod_data.get("name"),
-                            "displayName": prod_data.get("displayName"),
-                            "description": prod_data.get("description", ""),
-                            "approvalType": prod_data.get("approvalType"),
-                            "proxies": prod_data.get("proxies", []),
-                            "apiResources": prod_data.get("apiResources", []),
-                            "scopes": prod_data.get("scopes", []),
-                            "attributes": prod_data.get("attributes", []),
-                            "environments": prod_data.get("environments", [])
-                        })
+                    prod_data = pending.result()
+                    products.append({
+                        "name": prod_data.get("name"),
+                        "displayName": prod_data.get("displayName"),
+                        "description": prod_data.get("description", ""),
+                        "approvalType": prod_data.get("approvalType"),
+                        "proxies": prod_data.get("proxies", []),
+                        "apiResources": prod_data.get("apiResources", []),
+                        "scopes": prod_data.get("scopes", []),
+                        "attributes": prod_data.get("attributes", []),
+                        "environments": prod_data.get("environments", [])
+                    })
                 except Exception as e:
-                    logger.error(f"Failed to parse product {product_file}: {e}")
-        
+                    failures.append((product_file.path, e))
+        except FileNotFoundError:
+            # Resource folder not present in this export
+            pass
+
+        _log_failures("product", failures)
         return products
     
     def parse_target_servers(self) -> List[Dict[str, Any]]:
         """Parse target servers"""
         servers = []
+        failures = []
         servers_dir = self.data_dir / "targetservers" / "env"
         
-        if not servers_dir.exists():
-            return servers
-        
-        # Iterate through environments
-        for env_dir in servers_dir.iterdir():
-            if env_dir.is_dir():
+        try:
+            # Iterate through environments
+            for env_dir in _iter_dirs(servers_dir):
                 environment = env_dir.name
-                for server_file in env_dir.iterdir():
-                    if server_file.is_file():
-                        try:
-                            with open(server_file, 'r') as f:
-                                server_data = json.load(f)
-                                servers.append({
-                                    "name": server_data.get("name"),
-                                    "host": server_data.get("host"),
-                                    "port": server_data.get("port"),
-                                    "isEnabled": server_data.get("isEnabled"),
-                                    "environment": environment,
-                                    "sslEnabled": server_data.get("sSLInfo", {}).get("enabled") == "true",
-                                    "sslInfo": server_data.get("sSLInfo", {})
-                                })
-                        except Exception as e:
-                            logger.error(f"Failed to parse target server {server_file}: {e}")
-        
+                for server_file, pending in _load_json_files(_iter_files(env_dir.path)):
+                    try:
+                        server_data = pending.result()
+                        servers.append({
+                            "name": server_data.get("name"),
+                            "host": server_data.get("host"),
+                            "port": server_data.get("port"),
+                            "isEnabled": server_data.get("isEnabled"),
+                            "environment": environment,
+                            "sslEnabled": server_data.get("sSLInfo", {}).get("enabled") == "true",
+                            "sslInfo": server_data.get("sSLInfo", {})
+                        })
+                    except Exception as e:
+                        failures.append((server_file.path, e))
+        except FileNotFoundError:
+            # Resource folder not present in this export
+            pass
+
+        _log_failures("target server", failures)
         return servers
     
     def parse_kvms(self) -> List[Dict[str, Any]]:
         """Parse Key-Value Maps"""
         kvms = []
+        failures = []
         kvms_dir = self.data_dir / "keyvaluemaps" / "env"
         
-        if not kvms_dir.exists():
-            return kvms
-        
-        # Iterate through environments
-        for env_dir in kvms_dir.iterdir():
-            if env_dir.is_dir():
+        try:
+            # Iterate through environments
+            for env_dir in _iter_dirs(kvms_dir):
                 environment = env_dir.name
-                for kvm_file in env_dir.iterdir():
-                    if kvm_file.is_file():
-                        try:
-                            with open(kvm_file, 'r') as f:
-                                kvm_data = json.load(f)
-                                kvms.append({
-                                    "name": kvm_data.get("name"),
-                                    "environment": environment,
-                                    "encrypted": kvm_data.get("encrypted", False),
-                                    "entries": len(kvm_data.get("entry", []))
-                                })
-                        except Exception as e:
-                            logger.error(f"Failed to parse KVM {kvm_file}: {e}")
-        
+                for kvm_file, pending in _load_json_files(_iter_files(env_dir.path)):
+                    try:
+                        kvm_data = pending.result()
+                        kvms.append({
+                            "name": kvm_data.get("name"),
+                            "environment": environment,
+                            "encrypted": kvm_data.get("encrypted", False),
+                            "entries": len(kvm_data.get("entry", []))
+                        })
+                    except Exception as e:
+                        failures.append((kvm_file.path, e))
+        except FileNotFoundError:
+            # Resource folder not present in this export
+            pass
+
+        _log_failures("KVM", failures)
         return kvms
     
     def _parse_policy(self, policy_file: Path) -> Dict[str, Any]:
         """Parse policy XML file to extract policy type"""
         try:
-            # Simple XML parsing to get policy type
-            with open(policy_file, 'r') as f:
-                content = f.read()
-                # Extract policy type from XML root element
-                # This is a simplified approach
-                lines = content.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith('<') and not line.startswith('<?xml'):
-                        # Extract tag name
-                        tag = line.split()[0].replace('<', '').replace('>', '')
-                        if tag and not tag.startswith('/'):
-                            return {
-                                "name": policy_file.stem,
-                                "type": tag
-                            }
+            # The policy type is the root element: the first tag that is not a
+            # comment, processing instruction or declaration
+            for match in _XML_TAG_RE.finditer(policy_file.read_bytes()):
+                if match.group(1):
+                    return {
+                        "name": policy_file.stem,
+                        "type": match.group(1).decode()
+                    }
             return None
         except Exception as e:
-            logger.error(f"Failed to parse policy {policy_file}: {e}")
+            logger.error("Failed to parse policy %s: %s", policy_file, e)
             return None
     
     def get_summary(self) -> Dict[str, int]:
-        """Get summary counts of all resources"""
-        data = self.parse_all()
-        return {
-            "proxies": len(data["proxies"]),
-            "shared_flows": len(data["shared_flows"]),
-            "developers": len(data["developers"]),
-            "apps": len(data["apps"]),
-            "api_products": len(data["api_products"]),
-            "target_servers": len(data["target_servers"]),
-            "kvms": len(data["kvms"]),
-            "total": sum([
-                len(data["proxies"]),
-                len(data["shared_flows"]),
-                len(data["developers"]),
-                len(data["apps"]),
-                len(data["api_products"]),
-                len(data["target_servers"]),
-                len(data["kvms"])
-            ])
+        """Get summary counts of all resources by counting files, without parsing them"""
+        counts = {
+            "proxies": _count_entries(self.data_dir / "proxies", ".zip"),
+            "shared_flows": _count_entries(self.data_dir / "sharedflows", ".zip"),
+            "developers": _count_files(self.data_dir / "developers"),
+            "apps": _count_files(self.data_dir / "apps"),
+            "api_products": _count_files(self.data_dir / "apiproducts"),
+            "target_servers": _count_env_files(self.data_dir / "targetservers" / "env"),
+            "kvms": _count_env_files(self.data_dir / "keyvaluemaps" / "env")
         }
+        counts["total"] = sum(counts.values())
+        return counts
+    
+    @staticmethod
+    def summarize(data: Dict[str, Any]) -> Dict[str, int]:
+        """Get summary counts from an already parsed export"""
+        counts = {resource_type: len(items) for resource_type, items in data.items()}
+        counts["total"] = sum(counts.values())
+        return counts
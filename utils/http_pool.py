@@ -0,0 +1,38 @@
+"""Connection pool shared by every outbound HTTP client"""
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Retry once on a connect failure (any method), or on a read failure of an
+# idempotent request, which is how a pooled keep-alive connection the server
+# dropped while idle surfaces. POSTs are not retried after the request was
+# sent, since the server may already have created the resource
+_RETRY = Retry(
+    total=1,
+    connect=1,
+    read=1,
+    status=0,
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+)
+
+# Outbound calls are made from asyncio's default executor (asyncio.to_thread),
+# which holds up to min(32, cpu_count + 4) threads. The pool keeps a
+# connection for each, so none is discarded as "pool is full" after use
+_POOL_MAXSIZE = min(32, (os.cpu_count() or 1) + 4)
+
+# One adapter for every session in the process, so clients created per job or
+# per request reuse open TLS connections instead of handshaking again
+_shared_adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE, max_retries=_RETRY)
+
+
+def mount_shared_pool(session: requests.Session) -> requests.Session:
+    """Route a session's http(s) traffic through the shared connection pool"""
+    session.mount("https://", _shared_adapter)
+    session.mount("http://", _shared_adapter)
+    return session
+
+
+# Session for management API calls that carry their own headers per request
+http_session = mount_shared_pool(requests.Session())
@@ -1,17 +1,62 @@
 """Logging utilities for migration operations"""
 import logging
-from typing import List
-from datetime import datetime, timezone
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple, TYPE_CHECKING
+
+# logging.handlers pulls in socket, pickle and queue; it is only needed once
+# the first job logger starts the console listener
+if TYPE_CHECKING:
+    from logging.handlers import QueueHandler
+
+
+# Per-logger retention; the oldest lines are dropped once a cap is reached
+MAX_LOG_ENTRIES = 10000
+MAX_ISSUE_ENTRIES = 1000
+
+# Console output of every job is handed to one listener thread through a
+# queue, so logging a line never blocks the caller on the stream write
+_console_lock = threading.Lock()
+_console_handler: Optional["QueueHandler"] = None
+
+# Last formatted UTC second, shared by all job loggers: (epoch second, text)
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+
+def _get_console_handler() -> "QueueHandler":
+    """Shared queue handler, starting the console listener on first use"""
+    global _console_handler
+    with _console_lock:
+        if _console_handler is None:
+            import atexit
+            import queue
+            from logging.handlers import QueueHandler, QueueListener
+
+            records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            stream = logging.StreamHandler()
+            stream.setFormatter(logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            ))
+            listener = QueueListener(records, stream)
+            listener.start()
+            # Drain whatever is still queued when the process exits
+            atexit.register(listener.stop)
+            _console_handler = QueueHandler(records)
+        return _console_handler
 
 
 class MigrationLogger:
     """Custom logger for migration operations with in-memory storage"""
     
+    # One logger per job; fixed slots skip the per-instance __dict__
+    __slots__ = ('job_id', 'logs', 'errors', 'warnings', 'logger')
+    
     def __init__(self, job_id: str):
         self.job_id = job_id
-        self.logs: List[str] = []
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
+        self.logs: Deque[str] = deque(maxlen=MAX_LOG_ENTRIES)
+        self.errors: Deque[str] = deque(maxlen=MAX_ISSUE_ENTRIES)
+        self.warnings: Deque[str] = deque(maxlen=MAX_ISSUE_ENTRIES)
         
         # Set up standard logger
         self.logger = logging.getLogger(f"migration.{job_id}")
@@ -19,52 +64,56 @@ class MigrationLogger:
         
         # Add handler if not already present
         if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+            self.logger.addHandler(_get_console_handler())
     
-    def _add_timestamp(self, message: str) -> str:
-        """Add timestamp to log message"""
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        return f"[{timestamp}] {message}"
+    def _record(self, level: int, tag: str, message: str, console_msg: str, *args) -> str:
+        """Send one record to the console and return the stored line, both stamped with the same time"""
+        global _timestamp_cache
+        if self.logger.isEnabledFor(level):
+            # Attribute the record to whoever called info/error/warning/success
+            fn, lno, func, _ = self.logger.findCaller(False, 3)
+            record = self.logger.makeRecord(self.logger.name, level, fn, lno, console_msg, args, None, func)
+            self.logger.handle(record)
+            created = record.created
+        else:
+            created = time.time()
+        
+        now = int(created)
+        second, timestamp = _timestamp_cache
+        # Only re-format when the second has changed
+        if now != second:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(now))
+            _timestamp_cache = (now, timestamp)
+        return f"[{timestamp}] {tag}: {message}"
     
     def info(self, message: str):
         """Log info message"""
-        log_msg = self._add_timestamp(f"INFO: {message}")
-        self.logs.append(log_msg)
-        self.logger.info(message)
+        self.logs.append(self._record(logging.INFO, "INFO", message, message))
     
     def error(self, message: str):
         """Log error message"""
-        log_msg = self._add_timestamp(f"ERROR: {message}")
+        log_msg = self._record(logging.ERROR, "ERROR", message, message)
         self.errors.append(log_msg)
         self.logs.append(log_msg)
-        self.logger.error(message)
     
     def warning(self, message: str):
         """Log warning message"""
-        log_msg = self._add_timestamp(f"WARNING: {message}")
+        log_msg = self._record(logging.WARNING, "WARNING", message, message)
         self.warnings.append(log_msg)
         self.logs.append(log_msg)
-        self.logger.warning(message)
     
     def success(self, message: str):
         """Log success message"""
-        log_msg = self._add_timestamp(f"SUCCESS: {message}")
-        self.logs.append(log_msg)
-        self.logger.info(f"✓ {message}")
+        self.logs.append(self._record(logging.INFO, "SUCCESS", message, "✓ %s", message))
     
     def get_logs(self) -> List[str]:
         """Get all logs"""
-        return self.logs
+        return list(self.logs)
     
     def get_errors(self) -> List[str]:
         """Get all errors"""
-        return self.errors
+        return list(self.errors)
     
     def get_warnings(self) -> List[str]:
         """Get all warnings"""
-        return self.warnings
+        return list(self.warnings)